@@ -1,11 +1,12 @@
+import asyncio
+import atexit
 import os
-import re
-import threading
+import secrets
+from functools import lru_cache
 from typing import Optional
-from uuid import uuid4
 
 import httpx
-from pydantic import BaseModel, Field
+import orjson
 from pydantic.functional_validators import AfterValidator
 from typing_extensions import Annotated
 
@@ -16,37 +17,36 @@ __all__ = [
 ]
 
 
-# pydantic models
+# phone number validation
 
 
+@lru_cache(maxsize=4096)
 def validate_phone_number_usa(value: str) -> str:
-    if re.fullmatch(r"\d{10}", value) is None:
+    # cached because the same numbers recur across recipient groups (e.g. universals)
+    # equivalent to re.fullmatch(r"\d{10}", value), but without the regex engine
+    if len(value) != 10 or not value.isdigit():
         raise ValueError("not recognized as valid USA phone number; please write 10 digits with no other symbols or spaces")
     return value
 
 PhoneNumberUSA = Annotated[str, AfterValidator(validate_phone_number_usa)]
 
 
-class SmsRequestData(BaseModel):
-    target_device_iden: str = Field(min_length=1)
-    addresses: list[PhoneNumberUSA] = Field(min_length=1)
-    message: str
-    guid: Optional[str] = None
+# user interface
 
 
-class SendSmsRequest(BaseModel):
-    data: SmsRequestData
+class APIError(Exception):
+    """The remote API returned an error code"""
 
 
-class SendSmsResponse(BaseModel):
-    iden: str
+_shared_httpx_client: Optional[httpx.AsyncClient] = None
 
 
-# user interface
-
-
-class APIError(Exception):
-    """The remote API returned an error code"""
+def _close_shared_httpx_client():
+    """atexit hook; closes the shared client if one was created and is still open"""
+    global _shared_httpx_client
+    client, _shared_httpx_client = _shared_httpx_client, None
+    if client is not None and not client.is_closed:
+        asyncio.run(client.aclose())
 
 
 class PushBullet:
@@ -54,6 +54,8 @@ class PushBullet:
 
     PUSHBULLET_API_URL = "https://api.pushbullet.com"
 
+    __slots__ = ("_headers", "_send_url", "_device_iden", "_owns_client", "_httpx_client")
+
     def __init__(
             self,
             api_key: Optional[str] = None,
@@ -78,7 +80,8 @@ class PushBullet:
             If None, a new client instance is created and this `PushBullet` must be opened and closed using an `async with` block.
         """
         api_key = api_key or os.environ["PUSHBULLET_API_KEY"]
-        self._headers = {
+        # pre-built as httpx.Headers so httpx skips the dict->Headers conversion on every request
+        self._headers = httpx.Headers({
             "Authorization": f"Basic {api_key}",
             "Accept": "*/*",
             "Api-Version": "2014-05-07",
@@ -87,28 +90,51 @@ class PushBullet:
             "Referer": "https://pushbullet.com/",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36",
             "X-User-Agent": "Pushbullet Website 162",
-        }
+        })
+        self._send_url = f"{self.PUSHBULLET_API_URL}/v3/create-text"
         self._device_iden = device_iden or os.environ["PUSHBULLET_DEVICE_ID"]
-        self._httpx_client_lock = threading.Lock() if httpx_client is None else None
+        self._owns_client = httpx_client is None
         self._httpx_client = httpx_client
 
+    @staticmethod
+    def _new_httpx_client() -> httpx.AsyncClient:
+        """create an httpx.AsyncClient configured the way this API is best talked to"""
+        # HTTP/2 lets concurrent sends multiplex over one TCP+TLS connection
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(30.0),
+        )
+
+    @classmethod
+    def get_shared_client(cls) -> httpx.AsyncClient:
+        """
+        get a process-wide shared httpx.AsyncClient, creating it on first call.
+
+        Useful for long-lived processes that construct many `PushBullet` instances:
+        passing the shared client to `__init__` reuses one connection (and its TLS
+        handshake) across all of them. The client is closed automatically at
+        interpreter exit. All uses must happen on the same event loop.
+        """
+        global _shared_httpx_client
+        if _shared_httpx_client is None or _shared_httpx_client.is_closed:
+            _shared_httpx_client = cls._new_httpx_client()
+            atexit.register(_close_shared_httpx_client)
+        return _shared_httpx_client
+
     async def __aenter__(self):
         """async context manager open; instantiates and opens a httpx.AsyncClient if needed"""
-        lock = self._httpx_client_lock
-        if lock is not None:  # no external client was provided
-            with lock:
-                if self._httpx_client is not None:
-                    raise RuntimeError("cannot open a client that is already open")
-                self._httpx_client = httpx.AsyncClient()
+        if self._owns_client:  # no external client was provided
+            if self._httpx_client is not None:
+                raise RuntimeError("cannot open a client that is already open")
+            self._httpx_client = self._new_httpx_client()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         """async context manager close; closes our httpx.AsyncClient if we were the ones who opened it"""
-        lock = self._httpx_client_lock
-        if lock is not None:  # no external client was provided
-            with lock:
-                client = self._httpx_client
-                self._httpx_client = None
+        if self._owns_client:  # no external client was provided
+            client = self._httpx_client
+            self._httpx_client = None
             if client is not None:
                 await client.aclose()
 
@@ -149,19 +175,66 @@ class PushBullet:
         """
         if isinstance(phone_numbers, str):
             phone_numbers = [phone_numbers]
+        if len(phone_numbers) == 0:
+            raise ValueError("at least one phone number is required")
+        for phone_number in phone_numbers:
+            validate_phone_number_usa(phone_number)
         client = self._ensure_httpx_client()
-        message_uid = str(uuid4()).replace("-", "")[:22]
-        request = SendSmsRequest(data=SmsRequestData(
-            target_device_iden=self._device_iden,
-            addresses=phone_numbers,
-            message=message,
-            guid=message_uid,
-        ))
+        message_uid = secrets.token_hex(11)  # 22 hex chars
+        payload = {
+            "data": {
+                "target_device_iden": self._device_iden,
+                "addresses": phone_numbers,
+                "message": message,
+                "guid": message_uid,
+            },
+        }
         response = await client.post(
-            f"{self.PUSHBULLET_API_URL}/v3/create-text",
-            json=request.model_dump(),
+            self._send_url,
+            content=orjson.dumps(payload),  # headers already declare Content-Type: application/json
             headers=self._headers,
         )
         self.check_for_errors(response)
-        response_parsed = SendSmsResponse.model_validate(response.json())
-        return response_parsed.iden
+        try:
+            return orjson.loads(response.content)["iden"]
+        except (orjson.JSONDecodeError, KeyError) as e:
+            raise APIError(f"response did not contain a message ID ('iden'); "
+                           f"body/payload was {response.text!r}") from e
+
+    async def send_sms_batch(
+            self,
+            sends: list[tuple[list[str] | str, str]],
+            max_concurrency: int = 16,
+    ) -> list[str | Exception]:
+        """
+        send a batch of SMS messages, capping how many requests are in flight at once.
+
+        The PushBullet API has no true batch endpoint, so this issues one request per
+        message but bounds concurrency so a large batch doesn't exhaust the connection pool.
+
+        Parameters
+        ----------
+        sends : list[tuple[list[str] | str, str]]
+            one `(phone_numbers, message)` pair per SMS to send;
+            each pair is passed to `send_sms`
+        max_concurrency : int, optional
+            maximum number of requests in flight at once, by default 16
+
+        Returns
+        -------
+        list[str | Exception]
+            per-send results in the same order as `sends`;
+            each is a message ID (`iden`), or the exception that send raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_one(phone_numbers: list[str] | str, message: str) -> str | Exception:
+            async with semaphore:
+                try:
+                    return await self.send_sms(phone_numbers, message)
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(
+            *(send_one(phone_numbers, message) for phone_numbers, message in sends),
+        ))
@@ -1,9 +1,11 @@
 import asyncio
+import operator
 from pathlib import Path
 
+import orjson
 from pydantic import BaseModel
 
-from pushbullet_api import PhoneNumberUSA, PushBullet
+from pushbullet_api import PhoneNumberUSA, PushBullet, validate_phone_number_usa
 
 
 class RecipientSpecs(BaseModel):
@@ -37,28 +39,46 @@ class RecipientSpecs(BaseModel):
         return cls.model_validate(cls.Config.json_schema_extra["example"]).model_dump_json(indent=2)
 
 
-def load_data(recipients_filepath: Path) -> list[tuple[str, list[PhoneNumberUSA]]]:
-    with open(recipients_filepath, "r", encoding="utf-8") as f:
-        recipient_specs = RecipientSpecs.model_validate_json(f.read())
-    universals = set(recipient_specs.universals.values())
+def load_data(recipients_filepath: Path) -> list[tuple[str, list[str]]]:
+    # parsed with orjson and validated directly rather than through RecipientSpecs;
+    # the structure is trivial and this skips pydantic model construction for the whole file
+    with open(recipients_filepath, "rb") as f:
+        raw = orjson.loads(f.read())
+    universals = frozenset(raw.get("universals", {}).values())
     groups = {}
-    for group_name, group in recipient_specs.groups.items():
+    for group_name, group in raw.get("groups", {}).items():
+        group_numbers = set(universals)  # seed each group with a copy of the universals
         if isinstance(group, str):  # single phone number
-            group_numbers = {group}
+            group_numbers.add(group)
         else:  # dict
-            group_numbers = set(group.values())
-        groups[group_name] = sorted(group_numbers | universals)
-    groups_ordered = sorted(groups.items())
+            group_numbers.update(group.values())
+        groups[group_name] = list(group_numbers)  # unsorted; display sites sort just before printing
+    for phone_number in universals.union(*groups.values()):
+        if not isinstance(phone_number, str):
+            raise ValueError(f"expected a phone number string, got {phone_number!r}")
+        validate_phone_number_usa(phone_number)
+    groups_ordered = sorted(groups.items(), key=operator.itemgetter(0))
     return groups_ordered
 
 
-async def send_messages(message: str, groups_ordered: list[tuple[str, list[PhoneNumberUSA]]]) -> list[str | Exception]:
+async def send_messages(message: str, groups_ordered: list[tuple[str, list[str]]]) -> list[str | Exception]:
+    semaphore = asyncio.Semaphore(16)  # cap in-flight requests at the connection pool size
+    results: dict[str, str | Exception] = {}
     async with PushBullet() as pb:
-        results = await asyncio.gather(
-            *(pb.send_sms(phone_numbers, message) for _, phone_numbers in groups_ordered),
-            return_exceptions=True,
-        )
-    return results
+        async def send_one(group_name: str, phone_numbers: list[str]) -> tuple[str, str | Exception]:
+            async with semaphore:
+                try:
+                    return group_name, await pb.send_sms(phone_numbers, message)
+                except Exception as e:
+                    return group_name, e
+        for future in asyncio.as_completed([
+            send_one(group_name, phone_numbers)
+            for group_name, phone_numbers in groups_ordered
+        ]):
+            group_name, result = await future
+            results[group_name] = result
+            print(f"  sent {group_name!r}" if not isinstance(result, Exception) else f"  FAILED {group_name!r}")
+    return [results[group_name] for group_name, _ in groups_ordered]
 
 
 def main(recipients_filepath: Path, message_filepath: Path):
@@ -70,7 +90,7 @@ def main(recipients_filepath: Path, message_filepath: Path):
     print(message)
     print("----- RECIPIENTS -----")
     for group_name, phone_numbers in groups_ordered:
-        print(f"{group_name}:", ", ".join(phone_numbers))
+        print(f"{group_name}:", ", ".join(sorted(phone_numbers)))
     print("-" * 20)
     response = input("Would you like to send? (y/N): ")
     if response.strip().lower() not in ("y", "yes"):
@@ -82,7 +102,7 @@ def main(recipients_filepath: Path, message_filepath: Path):
     print("----- RESULTS -----")
     for (group_name, phone_numbers), result in zip(groups_ordered, results):
         print(f"{group_name}:")
-        print("  phone numbers:", ", ".join(phone_numbers))
+        print("  phone numbers:", ", ".join(sorted(phone_numbers)))
         print(f"  result: {result!r}")
 
 